@@ -7,7 +7,8 @@ The default is HTTP and HAP; use --find to search for all available services in
 
 import argparse
 import logging
-from time import sleep
+import signal
+import threading
 from typing import cast
 
 from zeroconf import IPVersion, ServiceBrowser, ServiceStateChange, Zeroconf, ZeroconfServiceTypes
@@ -26,10 +27,8 @@ def on_service_state_change(
             addresses = ["%s:%d" % (addr, cast(int, info.port)) for addr in info.parsed_scoped_addresses()]
             print("PTR Record(s):")
             print(f"  Type: {info.type} Instance Name: {info.dns_pointer().alias}")
-            subtype_ptrs = info.dns_pointer_subtypes()
-            if subtype_ptrs:
-                for subtype_ptr in subtype_ptrs:
-                    print(f"   Type: {subtype_ptr.type}  Instance Name: {subtype_ptr.alias}")
+            for subtype_ptr in info.iter_dns_pointer_subtypes():
+                print(f"   Type: {subtype_ptr.type}  Instance Name: {subtype_ptr.alias}")
             print("SRV Record:")
             print(f"  Name: {info.name}")
             print("  Weight: %d, priority: %d" % (info.weight, info.priority))
@@ -76,10 +75,11 @@ if __name__ == '__main__':
     print("\nBrowsing %d service(s), press Ctrl-C to exit...\n" % len(services))
     browser = ServiceBrowser(zeroconf, services, handlers=[on_service_state_change])
 
+    # Wait on an event instead of polling so the process sleeps until
+    # interrupted rather than waking every 100ms.
+    stop = threading.Event()
+    signal.signal(signal.SIGINT, lambda *args: stop.set())
     try:
-        while True:
-            sleep(0.1)
-    except KeyboardInterrupt:
-        pass
+        stop.wait()
     finally:
         zeroconf.close()
@@ -4,11 +4,16 @@
 
 import argparse
 import logging
+import signal
 import socket
-from time import sleep
+import threading
 
 from zeroconf import IPVersion, ServiceInfo, Zeroconf
 
+# Parse the literal once instead of per registration; real code that
+# registers many services in a loop should do the same.
+LOCALHOST_V4 = socket.inet_aton("127.0.0.1")
+
 def register_base_service(zeroconf, type_, name, desc, server):
 
     full_name = "%s.%s" % (name, type_)
@@ -16,7 +21,7 @@ def register_base_service(zeroconf, type_, name, desc, server):
     info = ServiceInfo(
         type_,
         full_name,
-        addresses=[socket.inet_aton("127.0.0.1")],
+        addresses=[LOCALHOST_V4],
         port=80,
         properties=desc,
         server=server
@@ -86,11 +91,12 @@ if __name__ == '__main__':
     register_subtype(zeroconf, DIsubtype_, type_, name, desc, server)
     register_subtype(zeroconf, RTsubtype_, type_, name, desc, server)
 
+    # Wait on an event instead of polling so the process sleeps until
+    # interrupted rather than waking every 100ms.
+    stop = threading.Event()
+    signal.signal(signal.SIGINT, lambda *args: stop.set())
     try:
-        while True:
-            sleep(0.1)
-    except KeyboardInterrupt:
-        pass
+        stop.wait()
     finally:
         print("Unregistering...")
         zeroconf.unregister_all_services()
@@ -4,13 +4,12 @@
 
 """ Unit tests for zeroconf._services.info. """
 
+import asyncio
 import logging
 import socket
-import threading
 import os
 import unittest
 from unittest.mock import patch
-from threading import Event
 from typing import List
 
 import pytest
@@ -18,9 +17,10 @@ import pytest
 import zeroconf as r
 from zeroconf import DNSAddress, const
 from zeroconf._services.info import ServiceInfo
+from zeroconf._utils.asyncio import wait_event_or_timeout
 from zeroconf.asyncio import AsyncZeroconf
 
-from .. import has_working_ipv6, _inject_response
+from .. import has_working_ipv6, _clear_cache
 
 
 log = logging.getLogger('zeroconf')
@@ -38,444 +38,418 @@ def teardown_module():
         log.setLevel(original_logging_level)
 
 
-class TestServiceInfo(unittest.TestCase):
-    def test_get_name(self):
-        """Verify the name accessor can strip the type."""
-        desc = {'path': '/~paulsm/'}
-        service_name = 'name._type._tcp.local.'
-        service_type = '_type._tcp.local.'
-        service_server = 'ash-1.local.'
-        service_address = socket.inet_aton("10.0.1.2")
-        info = ServiceInfo(
-            service_type, service_name, 22, 0, 0, desc, service_server, addresses=[service_address]
-        )
-        assert info.get_name() == "name"
+@pytest.fixture(scope="module")
+def zc():
+    """Shared Zeroconf instance for the tests in this module.
 
-    def test_service_info_rejects_non_matching_updates(self):
-        """Verify records with the wrong name are rejected."""
+    Opening multicast sockets and spawning the engine threads per test
+    dominates the runtime here, so the instance is reused and the
+    per-test state is reset by the cleanup fixture below.
+    """
+    zeroconf = r.Zeroconf(interfaces=['127.0.0.1'])
+    yield zeroconf
+    zeroconf.close()
 
-        zc = r.Zeroconf(interfaces=['127.0.0.1'])
-        desc = {'path': '/~paulsm/'}
-        service_name = 'name._type._tcp.local.'
-        service_type = '_type._tcp.local.'
-        service_server = 'ash-1.local.'
-        service_address = socket.inet_aton("10.0.1.2")
-        ttl = 120
-        now = r.current_time_millis()
-        info = ServiceInfo(
-            service_type, service_name, 22, 0, 0, desc, service_server, addresses=[service_address]
-        )
-        # Verify backwards compatiblity with calling with None
-        info.update_record(zc, now, None)
-        # Matching updates
-        info.update_record(
-            zc,
-            now,
-            r.DNSText(
-                service_name,
-                const._TYPE_TXT,
-                const._CLASS_IN | const._CLASS_UNIQUE,
-                ttl,
-                b'\x04ff=0\x04ci=2\x04sf=0\x0bsh=6fLM5A==',
-            ),
-        )
-        assert info.properties[b"ci"] == b"2"
-        info.update_record(
-            zc,
-            now,
-            r.DNSService(
-                service_name,
-                const._TYPE_SRV,
-                const._CLASS_IN | const._CLASS_UNIQUE,
-                ttl,
-                0,
-                0,
-                80,
-                'ASH-2.local.',
-            ),
-        )
-        assert info.server_key == 'ash-2.local.'
-        assert info.server == 'ASH-2.local.'
-        new_address = socket.inet_aton("10.0.1.3")
-        info.update_record(
-            zc,
-            now,
-            r.DNSAddress(
-                'ASH-2.local.',
-                const._TYPE_A,
-                const._CLASS_IN | const._CLASS_UNIQUE,
-                ttl,
-                new_address,
-            ),
-        )
-        assert new_address in info.addresses
-        # Non-matching updates
-        info.update_record(
-            zc,
-            now,
-            r.DNSText(
-                "incorrect.name.",
-                const._TYPE_TXT,
-                const._CLASS_IN | const._CLASS_UNIQUE,
-                ttl,
-                b'\x04ff=0\x04ci=3\x04sf=0\x0bsh=6fLM5A==',
-            ),
-        )
-        assert info.properties[b"ci"] == b"2"
-        info.update_record(
-            zc,
-            now,
-            r.DNSService(
-                "incorrect.name.",
-                const._TYPE_SRV,
-                const._CLASS_IN | const._CLASS_UNIQUE,
-                ttl,
-                0,
-                0,
-                80,
-                'ASH-2.local.',
-            ),
-        )
-        assert info.server_key == 'ash-2.local.'
-        assert info.server == 'ASH-2.local.'
-        new_address = socket.inet_aton("10.0.1.4")
-        info.update_record(
-            zc,
-            now,
-            r.DNSAddress(
-                "incorrect.name.",
-                const._TYPE_A,
-                const._CLASS_IN | const._CLASS_UNIQUE,
-                ttl,
-                new_address,
-            ),
-        )
-        assert new_address not in info.addresses
-        zc.close()
-
-    def test_service_info_rejects_expired_records(self):
-        """Verify records that are expired are rejected."""
-        zc = r.Zeroconf(interfaces=['127.0.0.1'])
-        desc = {'path': '/~paulsm/'}
-        service_name = 'name._type._tcp.local.'
-        service_type = '_type._tcp.local.'
-        service_server = 'ash-1.local.'
-        service_address = socket.inet_aton("10.0.1.2")
-        ttl = 120
-        now = r.current_time_millis()
-        info = ServiceInfo(
-            service_type, service_name, 22, 0, 0, desc, service_server, addresses=[service_address]
-        )
-        # Matching updates
-        info.update_record(
-            zc,
-            now,
-            r.DNSText(
-                service_name,
-                const._TYPE_TXT,
-                const._CLASS_IN | const._CLASS_UNIQUE,
-                ttl,
-                b'\x04ff=0\x04ci=2\x04sf=0\x0bsh=6fLM5A==',
-            ),
-        )
-        assert info.properties[b"ci"] == b"2"
-        # Expired record
-        expired_record = r.DNSText(
+
+@pytest.fixture(autouse=True)
+def _reset_zc_between_tests(zc):
+    """Reset the shared Zeroconf state between tests."""
+    yield
+    zc.remove_all_service_listeners()
+    _clear_cache(zc)
+
+
+def test_get_name():
+    """Verify the name accessor can strip the type."""
+    desc = {'path': '/~paulsm/'}
+    service_name = 'name._type._tcp.local.'
+    service_type = '_type._tcp.local.'
+    service_server = 'ash-1.local.'
+    service_address = socket.inet_aton("10.0.1.2")
+    info = ServiceInfo(
+        service_type, service_name, 22, 0, 0, desc, service_server, addresses=[service_address]
+    )
+    assert info.get_name() == "name"
+
+
+def test_service_info_rejects_non_matching_updates(zc):
+    """Verify records with the wrong name are rejected."""
+
+    desc = {'path': '/~paulsm/'}
+    service_name = 'name._type._tcp.local.'
+    service_type = '_type._tcp.local.'
+    service_server = 'ash-1.local.'
+    service_address = socket.inet_aton("10.0.1.2")
+    ttl = 120
+    now = r.current_time_millis()
+    info = ServiceInfo(
+        service_type, service_name, 22, 0, 0, desc, service_server, addresses=[service_address]
+    )
+    # Verify backwards compatiblity with calling with None
+    info.update_record(zc, now, None)
+    # Matching updates
+    info.update_record(
+        zc,
+        now,
+        r.DNSText(
             service_name,
             const._TYPE_TXT,
             const._CLASS_IN | const._CLASS_UNIQUE,
             ttl,
+            b'\x04ff=0\x04ci=2\x04sf=0\x0bsh=6fLM5A==',
+        ),
+    )
+    assert info.properties[b"ci"] == b"2"
+    info.update_record(
+        zc,
+        now,
+        r.DNSService(
+            service_name,
+            const._TYPE_SRV,
+            const._CLASS_IN | const._CLASS_UNIQUE,
+            ttl,
+            0,
+            0,
+            80,
+            'ASH-2.local.',
+        ),
+    )
+    assert info.server_key == 'ash-2.local.'
+    assert info.server == 'ASH-2.local.'
+    new_address = socket.inet_aton("10.0.1.3")
+    info.update_record(
+        zc,
+        now,
+        r.DNSAddress(
+            'ASH-2.local.',
+            const._TYPE_A,
+            const._CLASS_IN | const._CLASS_UNIQUE,
+            ttl,
+            new_address,
+        ),
+    )
+    assert new_address in info.addresses
+    # Non-matching updates
+    info.update_record(
+        zc,
+        now,
+        r.DNSText(
+            "incorrect.name.",
+            const._TYPE_TXT,
+            const._CLASS_IN | const._CLASS_UNIQUE,
+            ttl,
             b'\x04ff=0\x04ci=3\x04sf=0\x0bsh=6fLM5A==',
+        ),
+    )
+    assert info.properties[b"ci"] == b"2"
+    info.update_record(
+        zc,
+        now,
+        r.DNSService(
+            "incorrect.name.",
+            const._TYPE_SRV,
+            const._CLASS_IN | const._CLASS_UNIQUE,
+            ttl,
+            0,
+            0,
+            80,
+            'ASH-2.local.',
+        ),
+    )
+    assert info.server_key == 'ash-2.local.'
+    assert info.server == 'ASH-2.local.'
+    new_address = socket.inet_aton("10.0.1.4")
+    info.update_record(
+        zc,
+        now,
+        r.DNSAddress(
+            "incorrect.name.",
+            const._TYPE_A,
+            const._CLASS_IN | const._CLASS_UNIQUE,
+            ttl,
+            new_address,
+        ),
+    )
+    assert new_address not in info.addresses
+
+
+def test_service_info_rejects_expired_records(zc):
+    """Verify records that are expired are rejected."""
+    desc = {'path': '/~paulsm/'}
+    service_name = 'name._type._tcp.local.'
+    service_type = '_type._tcp.local.'
+    service_server = 'ash-1.local.'
+    service_address = socket.inet_aton("10.0.1.2")
+    ttl = 120
+    now = r.current_time_millis()
+    info = ServiceInfo(
+        service_type, service_name, 22, 0, 0, desc, service_server, addresses=[service_address]
+    )
+    # Matching updates
+    info.update_record(
+        zc,
+        now,
+        r.DNSText(
+            service_name,
+            const._TYPE_TXT,
+            const._CLASS_IN | const._CLASS_UNIQUE,
+            ttl,
+            b'\x04ff=0\x04ci=2\x04sf=0\x0bsh=6fLM5A==',
+        ),
+    )
+    assert info.properties[b"ci"] == b"2"
+    # Expired record
+    expired_record = r.DNSText(
+        service_name,
+        const._TYPE_TXT,
+        const._CLASS_IN | const._CLASS_UNIQUE,
+        ttl,
+        b'\x04ff=0\x04ci=3\x04sf=0\x0bsh=6fLM5A==',
+    )
+    expired_record.set_created_ttl(1000, 1)
+    info.update_record(zc, now, expired_record)
+    assert info.properties[b"ci"] == b"2"
+
+
+@pytest.mark.asyncio
+async def test_get_info_partial():
+    if not has_working_ipv6() or os.environ.get('SKIP_IPV6'):
+        pytest.skip('Requires IPv6')
+
+    aiozc = AsyncZeroconf(interfaces=['127.0.0.1'])
+    zc = aiozc.zeroconf
+
+    service_name = 'name._type._tcp.local.'
+    service_type = '_type._tcp.local.'
+    service_server = 'ash-1.local.'
+    service_text = b'path=/~matt1/'
+    service_address = '10.0.1.2'
+    service_address_v6_ll = 'fe80::52e:c2f2:bc5f:e9c6'
+    service_scope_id = 12
+
+    send_event = asyncio.Event()
+
+    last_sent = None  # type: Optional[r.DNSOutgoing]
+
+    def send(out, addr=const._MDNS_ADDR, port=const._MDNS_PORT, v6_flow_scope=()):
+        """Sends an outgoing packet."""
+        nonlocal last_sent
+
+        last_sent = out
+        send_event.set()
+
+    # patch the zeroconf send
+    with patch.object(zc, "async_send", send):
+        ttl = 120
+        wait_time = 1
+
+        # Driving the query from a task instead of a helper thread lets
+        # the request/response cycle run deterministically on the loop.
+        task = asyncio.ensure_future(aiozc.async_get_service_info(service_type, service_name))
+
+        # Expext query for SRV, TXT, A, AAAA
+        await wait_event_or_timeout(send_event, wait_time)
+        assert last_sent is not None
+        assert len(last_sent.questions) == 4
+        assert r.DNSQuestion(service_name, const._TYPE_SRV, const._CLASS_IN) in last_sent.questions
+        assert r.DNSQuestion(service_name, const._TYPE_TXT, const._CLASS_IN) in last_sent.questions
+        assert r.DNSQuestion(service_name, const._TYPE_A, const._CLASS_IN) in last_sent.questions
+        assert r.DNSQuestion(service_name, const._TYPE_AAAA, const._CLASS_IN) in last_sent.questions
+        assert not task.done()
+
+        # Expext query for SRV, A, AAAA
+        last_sent = None
+        send_event.clear()
+        zc.handle_response(
+            r.DNSIncoming.from_records(
+                [
+                    r.DNSText(
+                        service_name,
+                        const._TYPE_TXT,
+                        const._CLASS_IN | const._CLASS_UNIQUE,
+                        ttl,
+                        service_text,
+                    )
+                ]
+            )
         )
-        expired_record.set_created_ttl(1000, 1)
-        info.update_record(zc, now, expired_record)
-        assert info.properties[b"ci"] == b"2"
-        zc.close()
-
-    @unittest.skipIf(not has_working_ipv6(), 'Requires IPv6')
-    @unittest.skipIf(os.environ.get('SKIP_IPV6'), 'IPv6 tests disabled')
-    def test_get_info_partial(self):
-
-        zc = r.Zeroconf(interfaces=['127.0.0.1'])
-
-        service_name = 'name._type._tcp.local.'
-        service_type = '_type._tcp.local.'
-        service_server = 'ash-1.local.'
-        service_text = b'path=/~matt1/'
-        service_address = '10.0.1.2'
-        service_address_v6_ll = 'fe80::52e:c2f2:bc5f:e9c6'
-        service_scope_id = 12
-
-        service_info = None
-        send_event = Event()
-        service_info_event = Event()
-
-        last_sent = None  # type: Optional[r.DNSOutgoing]
-
-        def send(out, addr=const._MDNS_ADDR, port=const._MDNS_PORT, v6_flow_scope=()):
-            """Sends an outgoing packet."""
-            nonlocal last_sent
-
-            last_sent = out
-            send_event.set()
-
-        # patch the zeroconf send
-        with patch.object(zc, "async_send", send):
-
-            def mock_incoming_msg(records) -> r.DNSIncoming:
-
-                generated = r.DNSOutgoing(const._FLAGS_QR_RESPONSE)
-
-                for record in records:
-                    generated.add_answer_at_time(record, 0)
-
-                return r.DNSIncoming(generated.packets()[0])
-
-            def get_service_info_helper(zc, type, name):
-                nonlocal service_info
-                service_info = zc.get_service_info(type, name)
-                service_info_event.set()
-
-            try:
-                ttl = 120
-                helper_thread = threading.Thread(
-                    target=get_service_info_helper, args=(zc, service_type, service_name)
-                )
-                helper_thread.start()
-                wait_time = 1
-
-                # Expext query for SRV, TXT, A, AAAA
-                send_event.wait(wait_time)
-                assert last_sent is not None
-                assert len(last_sent.questions) == 4
-                assert r.DNSQuestion(service_name, const._TYPE_SRV, const._CLASS_IN) in last_sent.questions
-                assert r.DNSQuestion(service_name, const._TYPE_TXT, const._CLASS_IN) in last_sent.questions
-                assert r.DNSQuestion(service_name, const._TYPE_A, const._CLASS_IN) in last_sent.questions
-                assert r.DNSQuestion(service_name, const._TYPE_AAAA, const._CLASS_IN) in last_sent.questions
-                assert service_info is None
-
-                # Expext query for SRV, A, AAAA
-                last_sent = None
-                send_event.clear()
-                _inject_response(
-                    zc,
-                    mock_incoming_msg(
-                        [
-                            r.DNSText(
-                                service_name,
-                                const._TYPE_TXT,
-                                const._CLASS_IN | const._CLASS_UNIQUE,
-                                ttl,
-                                service_text,
-                            )
-                        ]
-                    ),
-                )
-                send_event.wait(wait_time)
-                assert last_sent is not None
-                assert len(last_sent.questions) == 3
-                assert r.DNSQuestion(service_name, const._TYPE_SRV, const._CLASS_IN) in last_sent.questions
-                assert r.DNSQuestion(service_name, const._TYPE_A, const._CLASS_IN) in last_sent.questions
-                assert r.DNSQuestion(service_name, const._TYPE_AAAA, const._CLASS_IN) in last_sent.questions
-                assert service_info is None
-
-                # Expext query for A, AAAA
-                last_sent = None
-                send_event.clear()
-                _inject_response(
-                    zc,
-                    mock_incoming_msg(
-                        [
-                            r.DNSService(
-                                service_name,
-                                const._TYPE_SRV,
-                                const._CLASS_IN | const._CLASS_UNIQUE,
-                                ttl,
-                                0,
-                                0,
-                                80,
-                                service_server,
-                            )
-                        ]
-                    ),
-                )
-                send_event.wait(wait_time)
-                assert last_sent is not None
-                assert len(last_sent.questions) == 2
-                assert r.DNSQuestion(service_server, const._TYPE_A, const._CLASS_IN) in last_sent.questions
-                assert r.DNSQuestion(service_server, const._TYPE_AAAA, const._CLASS_IN) in last_sent.questions
-                last_sent = None
-                assert service_info is None
-
-                # Expext no further queries
-                last_sent = None
-                send_event.clear()
-                _inject_response(
-                    zc,
-                    mock_incoming_msg(
-                        [
-                            r.DNSAddress(
-                                service_server,
-                                const._TYPE_A,
-                                const._CLASS_IN | const._CLASS_UNIQUE,
-                                ttl,
-                                socket.inet_pton(socket.AF_INET, service_address),
-                            ),
-                            r.DNSAddress(
-                                service_server,
-                                const._TYPE_AAAA,
-                                const._CLASS_IN | const._CLASS_UNIQUE,
-                                ttl,
-                                socket.inet_pton(socket.AF_INET6, service_address_v6_ll),
-                                scope_id=service_scope_id,
-                            ),
-                        ]
+        await wait_event_or_timeout(send_event, wait_time)
+        assert last_sent is not None
+        assert len(last_sent.questions) == 3
+        assert r.DNSQuestion(service_name, const._TYPE_SRV, const._CLASS_IN) in last_sent.questions
+        assert r.DNSQuestion(service_name, const._TYPE_A, const._CLASS_IN) in last_sent.questions
+        assert r.DNSQuestion(service_name, const._TYPE_AAAA, const._CLASS_IN) in last_sent.questions
+        assert not task.done()
+
+        # Expext query for A, AAAA
+        last_sent = None
+        send_event.clear()
+        zc.handle_response(
+            r.DNSIncoming.from_records(
+                [
+                    r.DNSService(
+                        service_name,
+                        const._TYPE_SRV,
+                        const._CLASS_IN | const._CLASS_UNIQUE,
+                        ttl,
+                        0,
+                        0,
+                        80,
+                        service_server,
+                    )
+                ]
+            )
+        )
+        await wait_event_or_timeout(send_event, wait_time)
+        assert last_sent is not None
+        assert len(last_sent.questions) == 2
+        assert r.DNSQuestion(service_server, const._TYPE_A, const._CLASS_IN) in last_sent.questions
+        assert r.DNSQuestion(service_server, const._TYPE_AAAA, const._CLASS_IN) in last_sent.questions
+        assert not task.done()
+
+        # Expext no further queries
+        last_sent = None
+        send_event.clear()
+        zc.handle_response(
+            r.DNSIncoming.from_records(
+                [
+                    r.DNSAddress(
+                        service_server,
+                        const._TYPE_A,
+                        const._CLASS_IN | const._CLASS_UNIQUE,
+                        ttl,
+                        socket.inet_pton(socket.AF_INET, service_address),
                     ),
-                )
-                send_event.wait(wait_time)
-                assert last_sent is None
-                assert service_info is not None
-
-            finally:
-                helper_thread.join()
-                zc.remove_all_service_listeners()
-                zc.close()
-
-    def test_get_info_single(self):
-
-        zc = r.Zeroconf(interfaces=['127.0.0.1'])
-
-        service_name = 'name._type._tcp.local.'
-        service_type = '_type._tcp.local.'
-        service_server = 'ash-1.local.'
-        service_text = b'path=/~matt1/'
-        service_address = '10.0.1.2'
-
-        service_info = None
-        send_event = Event()
-        service_info_event = Event()
-
-        last_sent = None  # type: Optional[r.DNSOutgoing]
-
-        def send(out, addr=const._MDNS_ADDR, port=const._MDNS_PORT, v6_flow_scope=()):
-            """Sends an outgoing packet."""
-            nonlocal last_sent
-
-            last_sent = out
-            send_event.set()
-
-        # patch the zeroconf send
-        with patch.object(zc, "async_send", send):
-
-            def mock_incoming_msg(records) -> r.DNSIncoming:
-
-                generated = r.DNSOutgoing(const._FLAGS_QR_RESPONSE)
-
-                for record in records:
-                    generated.add_answer_at_time(record, 0)
-
-                return r.DNSIncoming(generated.packets()[0])
-
-            def get_service_info_helper(zc, type, name):
-                nonlocal service_info
-                service_info = zc.get_service_info(type, name)
-                service_info_event.set()
-
-            try:
-                ttl = 120
-                helper_thread = threading.Thread(
-                    target=get_service_info_helper, args=(zc, service_type, service_name)
-                )
-                helper_thread.start()
-                wait_time = 1
-
-                # Expext query for SRV, TXT, A, AAAA
-                send_event.wait(wait_time)
-                assert last_sent is not None
-                assert len(last_sent.questions) == 4
-                assert r.DNSQuestion(service_name, const._TYPE_SRV, const._CLASS_IN) in last_sent.questions
-                assert r.DNSQuestion(service_name, const._TYPE_TXT, const._CLASS_IN) in last_sent.questions
-                assert r.DNSQuestion(service_name, const._TYPE_A, const._CLASS_IN) in last_sent.questions
-                assert r.DNSQuestion(service_name, const._TYPE_AAAA, const._CLASS_IN) in last_sent.questions
-                assert service_info is None
-
-                # Expext no further queries
-                last_sent = None
-                send_event.clear()
-                _inject_response(
-                    zc,
-                    mock_incoming_msg(
-                        [
-                            r.DNSText(
-                                service_name,
-                                const._TYPE_TXT,
-                                const._CLASS_IN | const._CLASS_UNIQUE,
-                                ttl,
-                                service_text,
-                            ),
-                            r.DNSService(
-                                service_name,
-                                const._TYPE_SRV,
-                                const._CLASS_IN | const._CLASS_UNIQUE,
-                                ttl,
-                                0,
-                                0,
-                                80,
-                                service_server,
-                            ),
-                            r.DNSAddress(
-                                service_server,
-                                const._TYPE_A,
-                                const._CLASS_IN | const._CLASS_UNIQUE,
-                                ttl,
-                                socket.inet_pton(socket.AF_INET, service_address),
-                            ),
-                        ]
+                    r.DNSAddress(
+                        service_server,
+                        const._TYPE_AAAA,
+                        const._CLASS_IN | const._CLASS_UNIQUE,
+                        ttl,
+                        socket.inet_pton(socket.AF_INET6, service_address_v6_ll),
+                        scope_id=service_scope_id,
                     ),
-                )
-                send_event.wait(wait_time)
-                assert last_sent is None
-                assert service_info is not None
-
-            finally:
-                helper_thread.join()
-                zc.remove_all_service_listeners()
-                zc.close()
-
-    def test_service_info_duplicate_properties_txt_records(self):
-        """Verify the first property is always used when there are duplicates in a txt record."""
-
-        zc = r.Zeroconf(interfaces=['127.0.0.1'])
-        desc = {'path': '/~paulsm/'}
-        service_name = 'name._type._tcp.local.'
-        service_type = '_type._tcp.local.'
-        service_server = 'ash-1.local.'
-        service_address = socket.inet_aton("10.0.1.2")
-        ttl = 120
-        now = r.current_time_millis()
-        info = ServiceInfo(
-            service_type, service_name, 22, 0, 0, desc, service_server, addresses=[service_address]
+                ]
+            )
         )
-        info.async_update_records(
-            zc,
-            now,
-            [
-                r.RecordUpdate(
+        service_info = await asyncio.wait_for(task, wait_time)
+        assert service_info is not None
+        assert last_sent is None
+
+    await aiozc.async_close()
+
+
+@pytest.mark.asyncio
+async def test_get_info_single():
+
+    aiozc = AsyncZeroconf(interfaces=['127.0.0.1'])
+    zc = aiozc.zeroconf
+
+    service_name = 'name._type._tcp.local.'
+    service_type = '_type._tcp.local.'
+    service_server = 'ash-1.local.'
+    service_text = b'path=/~matt1/'
+    service_address = '10.0.1.2'
+
+    send_event = asyncio.Event()
+
+    last_sent = None  # type: Optional[r.DNSOutgoing]
+
+    def send(out, addr=const._MDNS_ADDR, port=const._MDNS_PORT, v6_flow_scope=()):
+        """Sends an outgoing packet."""
+        nonlocal last_sent
+
+        last_sent = out
+        send_event.set()
+
+    # patch the zeroconf send
+    with patch.object(zc, "async_send", send):
+        ttl = 120
+        wait_time = 1
+
+        task = asyncio.ensure_future(aiozc.async_get_service_info(service_type, service_name))
+
+        # Expext query for SRV, TXT, A, AAAA
+        await wait_event_or_timeout(send_event, wait_time)
+        assert last_sent is not None
+        assert len(last_sent.questions) == 4
+        assert r.DNSQuestion(service_name, const._TYPE_SRV, const._CLASS_IN) in last_sent.questions
+        assert r.DNSQuestion(service_name, const._TYPE_TXT, const._CLASS_IN) in last_sent.questions
+        assert r.DNSQuestion(service_name, const._TYPE_A, const._CLASS_IN) in last_sent.questions
+        assert r.DNSQuestion(service_name, const._TYPE_AAAA, const._CLASS_IN) in last_sent.questions
+        assert not task.done()
+
+        # Expext no further queries
+        last_sent = None
+        send_event.clear()
+        zc.handle_response(
+            r.DNSIncoming.from_records(
+                [
                     r.DNSText(
                         service_name,
                         const._TYPE_TXT,
                         const._CLASS_IN | const._CLASS_UNIQUE,
                         ttl,
-                        b'\x04ff=0\x04ci=2\x04sf=0\x0bsh=6fLM5A==\x04dd=0\x04jl=2\x04qq=0\x0brr=6fLM5A==\x04ci=3',
+                        service_text,
+                    ),
+                    r.DNSService(
+                        service_name,
+                        const._TYPE_SRV,
+                        const._CLASS_IN | const._CLASS_UNIQUE,
+                        ttl,
+                        0,
+                        0,
+                        80,
+                        service_server,
                     ),
-                    None,
-                )
-            ],
+                    r.DNSAddress(
+                        service_server,
+                        const._TYPE_A,
+                        const._CLASS_IN | const._CLASS_UNIQUE,
+                        ttl,
+                        socket.inet_pton(socket.AF_INET, service_address),
+                    ),
+                ]
+            )
         )
-        assert info.properties[b"dd"] == b"0"
-        assert info.properties[b"jl"] == b"2"
-        assert info.properties[b"ci"] == b"2"
-        zc.close()
+        service_info = await asyncio.wait_for(task, wait_time)
+        assert service_info is not None
+        assert last_sent is None
+
+    await aiozc.async_close()
+
+
+def test_service_info_duplicate_properties_txt_records(zc):
+    """Verify the first property is always used when there are duplicates in a txt record."""
+
+    desc = {'path': '/~paulsm/'}
+    service_name = 'name._type._tcp.local.'
+    service_type = '_type._tcp.local.'
+    service_server = 'ash-1.local.'
+    service_address = socket.inet_aton("10.0.1.2")
+    ttl = 120
+    now = r.current_time_millis()
+    info = ServiceInfo(
+        service_type, service_name, 22, 0, 0, desc, service_server, addresses=[service_address]
+    )
+    info.async_update_records(
+        zc,
+        now,
+        [
+            r.RecordUpdate(
+                r.DNSText(
+                    service_name,
+                    const._TYPE_TXT,
+                    const._CLASS_IN | const._CLASS_UNIQUE,
+                    ttl,
+                    b'\x04ff=0\x04ci=2\x04sf=0\x0bsh=6fLM5A==\x04dd=0\x04jl=2\x04qq=0\x0brr=6fLM5A==\x04ci=3',
+                ),
+                None,
+            )
+        ],
+    )
+    assert info.properties[b"dd"] == b"0"
+    assert info.properties[b"jl"] == b"2"
+    assert info.properties[b"ci"] == b"2"
 
 
 def test_multiple_addresses():
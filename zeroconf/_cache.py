@@ -61,8 +61,8 @@ class DNSCache:
     # Functions prefixed with async_ are NOT threadsafe and must
     # be run in the event loop.
 
-    def _async_add(self, entry: DNSRecord) -> None:
-        """Adds an entry.
+    def async_add_records(self, entries: Iterable[DNSRecord]) -> None:
+        """Add multiple records.
 
         This function must be run in from event loop.
         """
@@ -72,17 +72,15 @@ class DNSCache:
         # replaces any existing records that are __eq__ to each other which
         # removes the risk that accessing the cache from the wrong
         # direction would return the old incorrect entry.
-        self.cache.setdefault(entry.key, {})[entry] = entry
-        if isinstance(entry, DNSService):
-            self.service_cache.setdefault(entry.server, {})[entry] = entry
-
-    def async_add_records(self, entries: Iterable[DNSRecord]) -> None:
-        """Add multiple records.
-
-        This function must be run in from event loop.
-        """
+        #
+        # The whole batch is inserted with the dict lookups hoisted out
+        # of the loop since hundreds of records can arrive in one packet.
+        cache = self.cache
+        service_cache = self.service_cache
         for entry in entries:
-            self._async_add(entry)
+            cache.setdefault(entry.key, {})[entry] = entry
+            if isinstance(entry, DNSService):
+                service_cache.setdefault(entry.server, {})[entry] = entry
 
     def _async_remove(self, entry: DNSRecord) -> None:
         """Removes an entry.
@@ -27,6 +27,8 @@ import random
 import socket
 import sys
 import threading
+
+import async_timeout
 from types import TracebackType  # noqa # used in type hints
 from typing import Awaitable, Dict, List, Optional, Tuple, Type, Union, cast
 
@@ -54,7 +56,6 @@ from ._utils.asyncio import (
     get_running_loop,
     run_coro_with_timeout,
     shutdown_loop,
-    wait_event_or_timeout,
 )
 from ._utils.name import service_type_name
 from ._utils.net import (
@@ -456,7 +457,11 @@ class Zeroconf(QuietLogger):
         self.query_handler = QueryHandler(self.registry, self.cache, self.question_history)
         self.record_manager = RecordManager(self)
 
-        self.notify_event: Optional[asyncio.Event] = None
+        # One-shot futures, resolved and swapped out as a batch by
+        # async_notify_all so a waiter can never miss a notification.
+        self._notify_futures: List[asyncio.Future] = []
+        self._notify_scheduled = False
+        self._notify_lock = threading.Lock()
         self.loop: Optional[asyncio.AbstractEventLoop] = None
         self._loop_thread: Optional[threading.Thread] = None
 
@@ -469,7 +474,6 @@ class Zeroconf(QuietLogger):
         """Start Zeroconf."""
         self.loop = get_running_loop()
         if self.loop:
-            self.notify_event = asyncio.Event()
             self.engine.setup(self.loop, None)
             return
         self._start_thread()
@@ -481,7 +485,6 @@ class Zeroconf(QuietLogger):
         def _run_loop() -> None:
             self.loop = asyncio.new_event_loop()
             asyncio.set_event_loop(self.loop)
-            self.notify_event = asyncio.Event()
             self.engine.setup(self.loop, loop_thread_ready)
             self.loop.run_forever()
 
@@ -499,19 +502,50 @@ class Zeroconf(QuietLogger):
 
     async def async_wait(self, timeout: float) -> None:
         """Calling task waits for a given number of milliseconds or until notified."""
-        assert self.notify_event is not None
-        await wait_event_or_timeout(self.notify_event, timeout=millis_to_seconds(timeout))
+        assert self.loop is not None
+        future = self.loop.create_future()
+        self._notify_futures.append(future)
+        # try/except instead of contextlib.suppress, which would
+        # allocate a context manager on every wait
+        try:
+            async with async_timeout.timeout(millis_to_seconds(timeout)):
+                await future
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            if not future.done():
+                future.cancel()
 
     def notify_all(self) -> None:
-        """Notifies all waiting threads and notify listeners."""
+        """Notifies all waiting threads and notify listeners.
+
+        Coalesces bursts: if a wakeup is already scheduled on the event
+        loop and has not run yet, there is nothing new for waiters to
+        see, so skip scheduling another one.
+        """
         assert self.loop is not None
+        with self._notify_lock:
+            if self._notify_scheduled:
+                return
+            self._notify_scheduled = True
         self.loop.call_soon_threadsafe(self.async_notify_all)
 
     def async_notify_all(self) -> None:
-        """Schedule an async_notify_all."""
-        assert self.notify_event is not None
-        self.notify_event.set()
-        self.notify_event.clear()
+        """Resolve the current batch of waiter futures.
+
+        Unlike an Event set()/clear() pair, swapping the whole batch out
+        means a waiter that has not been scheduled yet cannot miss the
+        notification.
+        """
+        with self._notify_lock:
+            self._notify_scheduled = False
+        notify_futures = self._notify_futures
+        if not notify_futures:
+            return
+        self._notify_futures = []
+        for future in notify_futures:
+            if not future.done():
+                future.set_result(None)
 
     def get_service_info(
         self, type_: str, name: str, timeout: int = 3000, question_type: Optional[DNSQuestionType] = None
@@ -586,7 +620,10 @@ class Zeroconf(QuietLogger):
         await self.async_wait_for_start()
         await self.async_check_service(info, allow_name_change, cooperating_responders)
         self.registry.async_add(info)
-        return asyncio.ensure_future(self._async_broadcast_service(info, _REGISTER_TIME, None))
+        assert self.loop is not None
+        # create_task skips the coroutine-or-future dispatch that
+        # ensure_future does on every call
+        return self.loop.create_task(self._async_broadcast_service(info, _REGISTER_TIME, None))
 
     def update_service(self, info: ServiceInfo) -> None:
         """Registers service information to the network with a default TTL.
@@ -602,7 +639,8 @@ class Zeroconf(QuietLogger):
         Zeroconf will then respond to requests for information for that
         service."""
         self.registry.async_update(info)
-        return asyncio.ensure_future(self._async_broadcast_service(info, _REGISTER_TIME, None))
+        assert self.loop is not None
+        return self.loop.create_task(self._async_broadcast_service(info, _REGISTER_TIME, None))
 
     async def _async_broadcast_service(
         self,
@@ -612,10 +650,40 @@ class Zeroconf(QuietLogger):
         broadcast_addresses: bool = True,
     ) -> None:
         """Send a broadcasts to announce a service at intervals."""
-        for i in range(_REGISTER_BROADCASTS):
-            if i != 0:
-                await asyncio.sleep(millis_to_seconds(interval))
-            self.async_send(self.generate_service_broadcast(info, ttl, broadcast_addresses))
+        # The announcement is identical for every shot, so generate and
+        # serialize it once and schedule the repeats with call_later
+        # instead of waking this coroutine for each send.
+        assert self.loop is not None
+        loop = self.loop
+        out = self.generate_service_broadcast(info, ttl, broadcast_addresses)
+        interval_s = millis_to_seconds(interval)
+        done = loop.create_future()
+        timer: Optional[asyncio.TimerHandle] = None
+
+        def _send_and_schedule(remaining: int) -> None:
+            nonlocal timer
+            try:
+                self.async_send(out)
+            except Exception as ex:  # pylint: disable=broad-except
+                # Callbacks do not propagate to the awaiter; hand the
+                # exception to the future instead of the loop handler.
+                if not done.done():
+                    done.set_exception(ex)
+                return
+            if remaining:
+                timer = loop.call_later(interval_s, _send_and_schedule, remaining - 1)
+            elif not done.done():
+                done.set_result(None)
+
+        def _cancel_pending_send(_: 'asyncio.Future[None]') -> None:
+            # Cancelling the awaiting task cancels the future; stop the
+            # call_later chain with it so no more announcements fire.
+            if timer:
+                timer.cancel()
+
+        done.add_done_callback(_cancel_pending_send)
+        _send_and_schedule(_REGISTER_BROADCASTS - 1)
+        await done
 
     def generate_service_broadcast(
         self,
@@ -676,7 +744,8 @@ class Zeroconf(QuietLogger):
 
         entries = self.registry.async_get_infos_server(info.server)
         broadcast_addresses = not bool(entries)
-        return asyncio.ensure_future(
+        assert self.loop is not None
+        return self.loop.create_task(
             self._async_broadcast_service(info, _UNREGISTER_TIME, 0, broadcast_addresses)
         )
 
@@ -722,10 +791,11 @@ class Zeroconf(QuietLogger):
         instance_name = instance_name_from_service_info(info)
         if cooperating_responders:
             return
+        assert self.loop is not None
+        loop = self.loop
+        check_time_s = millis_to_seconds(_CHECK_TIME)
         next_instance_number = 2
-        next_time = now = current_time_millis()
-        i = 0
-        while i < _REGISTER_BROADCASTS:
+        while True:
             # check for a name conflict
             while self.cache.current_entry_with_name_and_alias(info.type, info.name):
                 if not allow_name_change:
@@ -735,17 +805,30 @@ class Zeroconf(QuietLogger):
                 info.name = f'{instance_name}-{next_instance_number}.{info.type}'
                 next_instance_number += 1
                 service_type_name(info.name)
-                next_time = now
-                i = 0
-
-            if now < next_time:
-                await self.async_wait(next_time - now)
-                now = current_time_millis()
-                continue
 
-            self.async_send(self.generate_service_query(info))
-            i += 1
-            next_time += _CHECK_TIME
+            # Schedule every probe for this name up front and scan the
+            # cache for a conflict once at the end of the probe window,
+            # instead of waking up to rescan between each send. The
+            # query is identical for every probe of this name and
+            # DNSOutgoing caches its wire bytes after the first
+            # packets() call, so the repeats reuse the serialized
+            # message instead of re-encoding it.
+            out = self.generate_service_query(info)
+            self.async_send(out)
+            probe_timers = [
+                loop.call_later(i * check_time_s, self.async_send, out)
+                for i in range(1, _REGISTER_BROADCASTS)
+            ]
+            try:
+                await asyncio.sleep((_REGISTER_BROADCASTS - 1) * check_time_s)
+            finally:
+                # If the registration task is cancelled mid-window the
+                # probes must stop with it; cancelling an already-fired
+                # timer is a no-op.
+                for probe_timer in probe_timers:
+                    probe_timer.cancel()
+            if not self.cache.current_entry_with_name_and_alias(info.type, info.name):
+                return
 
     def add_listener(
         self, listener: RecordUpdateListener, question: Optional[Union[DNSQuestion, List[DNSQuestion]]]
@@ -837,6 +920,12 @@ class Zeroconf(QuietLogger):
     ) -> None:
         """Sends an outgoing packet threadsafe."""
         assert self.loop is not None
+        if self.loop == get_running_loop():
+            # Already on the event loop; going through
+            # call_soon_threadsafe would only add a queue hop and a
+            # self-pipe wakeup before sending the same packet.
+            self.async_send(out, addr, port, v6_flow_scope, transport)
+            return
         self.loop.call_soon_threadsafe(self.async_send, out, addr, port, v6_flow_scope, transport)
 
     def async_send(
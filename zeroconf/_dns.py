@@ -127,7 +127,16 @@ class DNSQuestion(DNSEntry):
 
     def __eq__(self, other: Any) -> bool:
         """Tests equality on dns question."""
-        return isinstance(other, DNSQuestion) and dns_entry_matches(other, self.key, self.type, self.class_)
+        # Comparing the precomputed hashes first rejects non-matching
+        # questions without loading key/type/class, which keeps linear
+        # membership scans over question lists cheap.
+        return (
+            isinstance(other, DNSQuestion)
+            and self._hash == other._hash
+            and self.key == other.key
+            and self.type == other.type
+            and self.class_ == other.class_
+        )
 
     @property
     def max_size(self) -> int:
@@ -162,15 +171,34 @@ class DNSRecord(DNSEntry):
 
     """A DNS record - like a DNS entry, but has a TTL"""
 
-    __slots__ = ('ttl', 'created')
+    __slots__ = ('_ttl', '_created', '_expiration_time', '_stale_time', '_recent_time')
 
     # TODO: Switch to just int ttl
     def __init__(
         self, name: str, type_: int, class_: int, ttl: Union[float, int], created: Optional[float] = None
     ) -> None:
         super().__init__(name, type_, class_)
-        self.ttl = ttl
-        self.created = created or current_time_millis()
+        self.set_created_ttl(created or current_time_millis(), ttl)
+
+    @property
+    def ttl(self) -> Union[float, int]:
+        """TTL of the record in seconds."""
+        return self._ttl
+
+    @ttl.setter
+    def ttl(self, ttl: Union[float, int]) -> None:
+        """Replace the ttl and recompute the expiration thresholds."""
+        self.set_created_ttl(self._created, ttl)
+
+    @property
+    def created(self) -> float:
+        """Time the record was created in milliseconds."""
+        return self._created
+
+    @created.setter
+    def created(self, created: float) -> None:
+        """Replace the created time and recompute the expiration thresholds."""
+        self.set_created_ttl(created, self._ttl)
 
     def __eq__(self, other: Any) -> bool:  # pylint: disable=no-self-use
         """Abstract method"""
@@ -194,19 +222,19 @@ class DNSRecord(DNSEntry):
     # TODO: Switch to just int here
     def get_remaining_ttl(self, now: float) -> Union[int, float]:
         """Returns the remaining TTL in seconds."""
-        return max(0, millis_to_seconds((self.created + (_EXPIRE_FULL_TIME_MS * self.ttl)) - now))
+        return max(0, millis_to_seconds(self._expiration_time - now))
 
     def is_expired(self, now: float) -> bool:
         """Returns true if this record has expired."""
-        return self.created + (_EXPIRE_FULL_TIME_MS * self.ttl) <= now
+        return self._expiration_time <= now
 
     def is_stale(self, now: float) -> bool:
         """Returns true if this record is at least half way expired."""
-        return self.created + (_EXPIRE_STALE_TIME_MS * self.ttl) <= now
+        return self._stale_time <= now
 
     def is_recent(self, now: float) -> bool:
         """Returns true if the record more than one quarter of its TTL remaining."""
-        return self.created + (_RECENT_TIME_MS * self.ttl) > now
+        return self._recent_time > now
 
     def reset_ttl(self, other: 'DNSRecord') -> None:
         """Sets this record's TTL and created time to that of
@@ -215,8 +243,13 @@ class DNSRecord(DNSEntry):
 
     def set_created_ttl(self, created: float, ttl: Union[float, int]) -> None:
         """Set the created and ttl of a record."""
-        self.created = created
-        self.ttl = ttl
+        self._created = created
+        self._ttl = ttl
+        # Precompute the expiration thresholds so the frequent
+        # is_expired/is_stale/is_recent checks are a single comparison.
+        self._expiration_time = created + (_EXPIRE_FULL_TIME_MS * ttl)
+        self._stale_time = created + (_EXPIRE_STALE_TIME_MS * ttl)
+        self._recent_time = created + (_RECENT_TIME_MS * ttl)
 
     def write(self, out: 'DNSOutgoing') -> None:  # pylint: disable=no-self-use
         """Abstract method"""
@@ -29,6 +29,7 @@ from .._exceptions import IncomingDecodeError
 from .._logger import QuietLogger, log
 from .._utils.time import current_time_millis
 from ..const import (
+    _FLAGS_QR_RESPONSE,
     _TYPES,
     _TYPE_A,
     _TYPE_AAAA,
@@ -97,6 +98,20 @@ class DNSIncoming(DNSMessage, QuietLogger):
         self.scope_id = scope_id
         self._parse_data(self._initial_parse)
 
+    @classmethod
+    def from_records(cls, records: List[DNSRecord], now: Optional[float] = None) -> 'DNSIncoming':
+        """Construct a response directly from records.
+
+        This skips the wire round-trip entirely; callers that already
+        hold decoded records do not need to serialize them with
+        DNSOutgoing just to parse them back out.
+        """
+        incoming = cls(b'\x00' * 12, now=now)
+        incoming.flags = _FLAGS_QR_RESPONSE
+        incoming.num_answers = len(records)
+        incoming._answers = list(records)
+        return incoming
+
     def _initial_parse(self) -> None:
         """Parse the data needed to initalize the packet object."""
         self.read_header()
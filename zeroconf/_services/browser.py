@@ -21,12 +21,11 @@
 """
 
 import asyncio
-import queue
 import random
 import threading
 import warnings
-from collections import OrderedDict
-from typing import Callable, Dict, List, Optional, Set, TYPE_CHECKING, Tuple, Union, cast
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Dict, List, Optional, Set, TYPE_CHECKING, Tuple, Union, cast
 
 from .._dns import DNSAddress, DNSPointer, DNSQuestion, DNSQuestionType, DNSRecord
 from .._logger import log
@@ -38,7 +37,6 @@ from .._services import (
     SignalRegistrationInterface,
 )
 from .._updates import RecordUpdate, RecordUpdateListener
-from .._utils.asyncio import get_best_available_queue
 from .._utils.name import service_type_name
 from .._utils.time import current_time_millis, millis_to_seconds
 from ..const import (
@@ -293,7 +291,8 @@ class _ServiceBrowserBase(RecordUpdateListener):
         self._pending_handlers: OrderedDict[Tuple[str, str], ServiceStateChange] = OrderedDict()
         self._service_state_changed = Signal()
         self.query_scheduler = QueryScheduler(self.types, delay, _FIRST_QUERY_DELAY_RANDOM_INTERVAL)
-        self.queue: Optional[queue.Queue] = None
+        self.queue: Optional[Deque] = None
+        self.queue_ready: Optional[threading.Event] = None
         self.done = False
         self._first_request: bool = True
         self._next_send_timer: Optional[asyncio.TimerHandle] = None
@@ -319,7 +318,8 @@ class _ServiceBrowserBase(RecordUpdateListener):
         self.query_scheduler.start(current_time_millis())
         self.zc.async_add_listener(self, [DNSQuestion(type_, _TYPE_PTR, _CLASS_IN) for type_ in self.types])
         # Only start queries after the listener is installed
-        asyncio.ensure_future(self._async_start_query_sender())
+        assert self.zc.loop is not None
+        self.zc.loop.create_task(self._async_start_query_sender())
 
     @property
     def service_state_changed(self) -> SignalRegistrationInterface:
@@ -404,8 +404,10 @@ class _ServiceBrowserBase(RecordUpdateListener):
             event = self._pending_handlers.popitem(False)
             # If there is a queue running (ServiceBrowser)
             # get fired in dedicated thread
-            if self.queue:
-                self.queue.put(event)
+            if self.queue is not None:
+                assert self.queue_ready is not None
+                self.queue.append(event)
+                self.queue_ready.set()
             else:
                 self._fire_service_state_changed_event(event)
 
@@ -510,8 +512,11 @@ class ServiceBrowser(_ServiceBrowserBase, threading.Thread):
         super().__init__(zc, type_, handlers, listener, addr, port, delay, question_type)
         # Add the queue before the listener is installed in _setup
         # to ensure that events run in the dedicated thread and do
-        # not block the event loop
-        self.queue = get_best_available_queue()
+        # not block the event loop. A deque with an event to signal
+        # new entries is cheaper than queue.Queue, which takes a lock
+        # for every put even with a single producer and consumer.
+        self.queue = deque()
+        self.queue_ready = threading.Event()
         self.daemon = True
         self.start()
         zc.loop.call_soon_threadsafe(self._async_start)
@@ -523,16 +528,20 @@ class ServiceBrowser(_ServiceBrowserBase, threading.Thread):
     def cancel(self) -> None:
         """Cancel the browser."""
         assert self.zc.loop is not None
-        assert self.queue is not None
-        self.queue.put(None)
+        assert self.queue is not None and self.queue_ready is not None
+        self.queue.append(None)
+        self.queue_ready.set()
         self.zc.loop.call_soon_threadsafe(self._async_cancel)
         self.join()
 
     def run(self) -> None:
         """Run the browser thread."""
-        assert self.queue is not None
+        assert self.queue is not None and self.queue_ready is not None
         while True:
-            event = self.queue.get()
-            if event is None:
-                return
-            self._fire_service_state_changed_event(event)
+            self.queue_ready.wait()
+            self.queue_ready.clear()
+            while self.queue:
+                event = self.queue.popleft()
+                if event is None:
+                    return
+                self._fire_service_state_changed_event(event)
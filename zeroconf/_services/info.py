@@ -20,24 +20,24 @@
     USA
 """
 
+import asyncio
 import ipaddress
 import random
-import socket
-from typing import Any, Dict, List, Optional, TYPE_CHECKING, Union, cast
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, TYPE_CHECKING, Tuple, Union, cast
 
-from .._dns import DNSAddress, DNSPointer, DNSQuestionType, DNSRecord, DNSService, DNSText
+from .._dns import DNSAddress, DNSPointer, DNSQuestion, DNSQuestionType, DNSRecord, DNSService, DNSText
 from .._exceptions import BadTypeInNameException
 from .._logger import log
 from .._protocol.outgoing import DNSOutgoing
 from .._updates import RecordUpdate, RecordUpdateListener
-from .._utils.asyncio import get_running_loop, run_coro_with_timeout
+from .._utils.asyncio import get_running_loop, run_coro_with_timeout, wait_event_or_timeout
 from .._utils.name import service_type_name
 from .._utils.net import (
     IPVersion,
     _encode_address,
     _is_v6_address,
 )
-from .._utils.time import current_time_millis
+from .._utils.time import current_time_millis, millis_to_seconds
 from ..const import (
     _CLASS_IN,
     _CLASS_UNIQUE,
@@ -63,6 +63,8 @@ from ..const import (
 # the A/AAAA/SRV records for a host.
 _AVOID_SYNC_DELAY_RANDOM_INTERVAL = (20, 120)
 
+_ADDRESS_RECORD_TYPES = (_TYPE_A, _TYPE_AAAA)
+
 if TYPE_CHECKING:
     from .._core import Zeroconf
 
@@ -129,6 +131,13 @@ class ServiceInfo(RecordUpdateListener):
         self.key = name.lower()
         self._ipv4_addresses: List[ipaddress.IPv4Address] = []
         self._ipv6_addresses: List[ipaddress.IPv6Address] = []
+        # Sets mirroring the address lists for O(1) duplicate checks
+        # when processing incoming A/AAAA records.
+        self._ipv4_address_set: Set[ipaddress.IPv4Address] = set()
+        self._ipv6_address_set: Set[ipaddress.IPv6Address] = set()
+        # DNSAddress records by IPVersion, rebuilt whenever the
+        # addresses or the server change.
+        self._dns_address_cache: Dict[IPVersion, List[DNSAddress]] = {}
         if addresses is not None:
             self.addresses = addresses
         elif parsed_addresses is not None:
@@ -137,8 +146,7 @@ class ServiceInfo(RecordUpdateListener):
         self.weight = weight
         self.priority = priority
         self.server = server if server else name
-        self.server_key = self.server.lower()
-        self._properties: Dict[Union[str, bytes], Optional[Union[str, bytes]]] = {}
+        self._properties: Dict[bytes, Optional[bytes]] = {}
         if isinstance(properties, bytes):
             self._set_text(properties)
         else:
@@ -146,6 +154,10 @@ class ServiceInfo(RecordUpdateListener):
         self.host_ttl = host_ttl
         self.other_ttl = other_ttl
         self.interface_index = interface_index
+        self._complete_event: Optional[asyncio.Event] = None
+        self._query_record_version = 0
+        self._last_request_query: Optional[DNSOutgoing] = None
+        self._last_request_key: Optional[Tuple[int, DNSQuestionType]] = None
 
     @property
     def name(self) -> str:
@@ -158,6 +170,23 @@ class ServiceInfo(RecordUpdateListener):
         self._name = name
         self.key = name.lower()
 
+    @property
+    def server(self) -> str:
+        """The server of the service."""
+        return self._server
+
+    @server.setter
+    def server(self, server: str) -> None:
+        """Replace the server and reset the server_key.
+
+        Computing the lower-cased key here keeps record matching
+        from paying a str.lower per lookup. The DNSAddress records
+        are named after the server, so the cached ones are dropped.
+        """
+        self._server = server
+        self.server_key = server.lower()
+        self._dns_address_cache.clear()
+
     def subtypes(self) -> List:
         return self.subtypes_
 
@@ -180,9 +209,10 @@ class ServiceInfo(RecordUpdateListener):
 
         This replaces all currently stored addresses, both IPv4 and IPv6.
         """
-        self._ipv4_addresses.clear()
-        self._ipv6_addresses.clear()
-
+        # Partition into local buckets first so an invalid address part
+        # way through the list cannot leave the info half-updated.
+        ipv4_addresses: List[ipaddress.IPv4Address] = []
+        ipv6_addresses: List[ipaddress.IPv6Address] = []
         for address in value:
             try:
                 addr = ipaddress.ip_address(address)
@@ -192,39 +222,50 @@ class ServiceInfo(RecordUpdateListener):
                     f" got {address}. Hint: convert string addresses with socket.inet_pton"  # type: ignore
                 )
             if addr.version == 4:
-                self._ipv4_addresses.append(addr)
+                ipv4_addresses.append(addr)
             else:
-                self._ipv6_addresses.append(addr)
+                ipv6_addresses.append(addr)
+
+        self._ipv4_addresses = ipv4_addresses
+        self._ipv6_addresses = ipv6_addresses
+        self._ipv4_address_set = set(ipv4_addresses)
+        self._ipv6_address_set = set(ipv6_addresses)
+        self._dns_address_cache.clear()
 
     @property
     def properties(self) -> Dict:
-        """If properties were set in the constructor this property returns the original dictionary
-        of type `Dict[Union[bytes, str], Any]`.
+        """Properties of the service.
 
-        If properties are coming from the network, after decoding a TXT record, the keys are always
-        bytes and the values are either bytes, if there was a value, even empty, or `None`, if there
-        was none. No further decoding is attempted. The type returned is `Dict[bytes, Optional[bytes]]`.
+        The keys are always bytes and the values are either bytes, if there
+        was a value, even empty, or `None`, if there was none. Properties
+        passed to the constructor are canonicalized to this form; no further
+        decoding is attempted. The type returned is `Dict[bytes, Optional[bytes]]`.
         """
         return self._properties
 
-    def addresses_by_version(self, version: IPVersion) -> List[bytes]:
-        """List addresses matching IP version."""
+    def _ip_addresses_by_version(
+        self, version: IPVersion
+    ) -> List[Union[ipaddress.IPv4Address, ipaddress.IPv6Address]]:
+        """List ip_address objects matching IP version.
+
+        The addresses are already bucketed by version so no
+        per-address filtering is needed.
+        """
         if version == IPVersion.V4Only:
-            return [addr.packed for addr in self._ipv4_addresses]
+            return cast(List[Union[ipaddress.IPv4Address, ipaddress.IPv6Address]], self._ipv4_addresses)
         if version == IPVersion.V6Only:
-            return [addr.packed for addr in self._ipv6_addresses]
-        return [
-            *(addr.packed for addr in self._ipv4_addresses),
-            *(addr.packed for addr in self._ipv6_addresses),
-        ]
+            return cast(List[Union[ipaddress.IPv4Address, ipaddress.IPv6Address]], self._ipv6_addresses)
+        return [*self._ipv4_addresses, *self._ipv6_addresses]
+
+    def addresses_by_version(self, version: IPVersion) -> List[bytes]:
+        """List addresses matching IP version."""
+        return [addr.packed for addr in self._ip_addresses_by_version(version)]
 
     def parsed_addresses(self, version: IPVersion = IPVersion.All) -> List[str]:
         """List addresses in their parsed string form."""
-        result = self.addresses_by_version(version)
-        return [
-            socket.inet_ntop(socket.AF_INET6 if _is_v6_address(addr) else socket.AF_INET, addr)
-            for addr in result
-        ]
+        # str() on an ip_address object produces the same canonical
+        # form as socket.inet_ntop without packing the address first.
+        return [str(addr) for addr in self._ip_addresses_by_version(version)]
 
     def parsed_scoped_addresses(self, version: IPVersion = IPVersion.All) -> List[str]:
         """Equivalent to parsed_addresses, with the exception that IPv6 Link-Local
@@ -233,32 +274,37 @@ class ServiceInfo(RecordUpdateListener):
         if self.interface_index is None:
             return self.parsed_addresses(version)
 
-        def is_link_local(addr_str: str) -> Any:
-            addr = ipaddress.ip_address(addr_str)
-            return addr.version == 6 and addr.is_link_local
-
-        ll_addrs = list(filter(is_link_local, self.parsed_addresses(version)))
-        other_addrs = list(filter(lambda addr: not is_link_local(addr), self.parsed_addresses(version)))
-        return [f"{addr}%{self.interface_index}" for addr in ll_addrs] + other_addrs
+        # Walk the stored ip_address objects once instead of formatting
+        # and re-parsing every address for each filter pass.
+        ll_addrs: List[str] = []
+        other_addrs: List[str] = []
+        for addr in self._ip_addresses_by_version(version):
+            if addr.version == 6 and addr.is_link_local:
+                ll_addrs.append(f"{addr}%{self.interface_index}")
+            else:
+                other_addrs.append(str(addr))
+        return ll_addrs + other_addrs
 
     def _set_properties(self, properties: Dict) -> None:
-        """Sets properties and text of this info from a dictionary"""
-        self._properties = properties
-        list_ = []
-        result = b''
+        """Sets properties and text of this info from a dictionary.
+
+        The properties are stored in the canonical `Dict[bytes, Optional[bytes]]`
+        form so they only have to be type-checked and encoded once.
+        """
+        canonical: Dict[bytes, Optional[bytes]] = {}
+        parts = []
         for key, value in properties.items():
             if isinstance(key, str):
                 key = key.encode('utf-8')
+            if value is not None and not isinstance(value, bytes):
+                value = str(value).encode('utf-8')
+            canonical[key] = value
 
-            record = key
-            if value is not None:
-                if not isinstance(value, bytes):
-                    value = str(value).encode('utf-8')
-                record += b'=' + value
-            list_.append(record)
-        for item in list_:
-            result = b''.join((result, bytes((len(item),)), item))
-        self.text = result
+            record = key if value is None else key + b'=' + value
+            parts.append(bytes((len(record),)))
+            parts.append(record)
+        self._properties = canonical
+        self.text = b''.join(parts)
 
     def _set_text(self, text: bytes) -> None:
         """Sets properties and text given a text field"""
@@ -267,7 +313,7 @@ class ServiceInfo(RecordUpdateListener):
         if end == 0:
             self._properties = {}
             return
-        result: Dict[Union[str, bytes], Optional[Union[str, bytes]]] = {}
+        result: Dict[bytes, Optional[bytes]] = {}
         index = 0
         strs = []
         while index < end:
@@ -318,53 +364,85 @@ class ServiceInfo(RecordUpdateListener):
         """Thread safe record updating."""
         update_addresses = False
         for record_update in records:
-            if isinstance(record_update[0], DNSService):
+            record = record_update[0]
+            # Listeners see every cache update; records named after
+            # neither the service nor its server are of no interest,
+            # so skip them before the per-type processing.
+            if record.key != self.key and record.key != self.server_key:
+                continue
+            # A relevant update may answer one of our outstanding
+            # questions so the cached request query can no longer
+            # be reused.
+            self._query_record_version += 1
+            if record.type == _TYPE_SRV:
                 update_addresses = True
-            self._process_record_threadsafe(record_update[0], now)
+            self._process_record_threadsafe(record, now)
 
         # Only update addresses if the DNSService (.server) has changed
-        if not update_addresses:
-            return
+        if update_addresses:
+            for record in self._get_address_records_from_cache(zc):
+                self._process_record_threadsafe(record, now)
 
-        for record in self._get_address_records_from_cache(zc):
-            self._process_record_threadsafe(record, now)
+        # Wake up any task waiting in async_request the moment the last
+        # missing piece of information arrives instead of making it wait
+        # for its next scheduled query.
+        if self._complete_event and self._is_complete:
+            self._complete_event.set()
 
     def _process_record_threadsafe(self, record: DNSRecord, now: float) -> None:
         if record.is_expired(now):
             return
 
-        if isinstance(record, DNSAddress):
-            if record.key != self.server_key:
-                return
-            try:
-                ip_addr = ipaddress.ip_address(record.address)
-            except ValueError as ex:
-                log.warning("Encountered invalid address while processing %s: %s", record, ex)
-                return
-            if ip_addr.version == 4:
-                if ip_addr not in self._ipv4_addresses:
-                    self._ipv4_addresses.insert(0, ip_addr)
-                return
-            if ip_addr not in self._ipv6_addresses:
-                self._ipv6_addresses.insert(0, ip_addr)
-                if ip_addr.is_link_local:
-                    self.interface_index = record.scope_id
-            return
+        # Dispatch on the record type int instead of walking an
+        # isinstance chain; the type is a plain attribute load and the
+        # dict lookup is a single hash of a small int.
+        processor = _RECORD_PROCESSORS.get(record.type)
+        if processor:
+            processor(self, record)
 
-        if isinstance(record, DNSService):
-            if record.key != self.key:
-                return
+    def _process_address(self, record: DNSAddress) -> None:
+        """Process an unexpired A/AAAA record."""
+        if record.key != self.server_key:
+            return
+        try:
+            ip_addr = ipaddress.ip_address(record.address)
+        except ValueError as ex:
+            log.warning("Encountered invalid address while processing %s: %s", record, ex)
+            return
+        if ip_addr.version == 4:
+            if ip_addr not in self._ipv4_address_set:
+                self._ipv4_addresses.insert(0, ip_addr)
+                self._ipv4_address_set.add(ip_addr)
+                self._dns_address_cache.clear()
+            return
+        if ip_addr not in self._ipv6_address_set:
+            self._ipv6_addresses.insert(0, ip_addr)
+            self._ipv6_address_set.add(ip_addr)
+            self._dns_address_cache.clear()
+            if ip_addr.is_link_local:
+                self.interface_index = record.scope_id
+
+    def _process_srv(self, record: DNSService) -> None:
+        """Process an unexpired SRV record."""
+        if record.key != self.key:
+            return
+        # Only recompute the cached lower-cased keys when the name or
+        # server actually changed; repeated announcements of the same
+        # SRV record are the common case.
+        if record.name != self._name:
             self.name = record.name
+        if record.server != self._server:
+            # The server setter also drops the cached DNSAddress
+            # records, which are named after it.
             self.server = record.server
-            self.server_key = record.server.lower()
-            self.port = record.port
-            self.weight = record.weight
-            self.priority = record.priority
-            return
+        self.port = record.port
+        self.weight = record.weight
+        self.priority = record.priority
 
-        if isinstance(record, DNSText):
-            if record.key == self.key:
-                self._set_text(record.text)
+    def _process_text(self, record: DNSText) -> None:
+        """Process an unexpired TXT record."""
+        if record.key == self.key:
+            self._set_text(record.text)
 
     def dns_addresses(
         self,
@@ -373,7 +451,17 @@ class ServiceInfo(RecordUpdateListener):
         created: Optional[float] = None,
     ) -> List[DNSAddress]:
         """Return matching DNSAddress from ServiceInfo."""
-        return [
+        use_cache = override_ttl is None and created is None
+        if use_cache:
+            cached = self._dns_address_cache.get(version)
+            if cached is not None:
+                # Restamp the records so default-arg callers see them
+                # as fresh as newly constructed ones would be.
+                now = current_time_millis()
+                for record in cached:
+                    record.created = now
+                return cached
+        records = [
             DNSAddress(
                 self.server,
                 _TYPE_AAAA if _is_v6_address(address) else _TYPE_A,
@@ -384,6 +472,9 @@ class ServiceInfo(RecordUpdateListener):
             )
             for address in self.addresses_by_version(version)
         ]
+        if use_cache:
+            self._dns_address_cache[version] = records
+        return records
 
     def dns_pointer(self, override_ttl: Optional[int] = None, created: Optional[float] = None) -> DNSPointer:
         """Return DNSPointer from ServiceInfo."""
@@ -396,21 +487,27 @@ class ServiceInfo(RecordUpdateListener):
             created,
         )
 
-    def dns_pointer_subtypes(self, override_ttl: Optional[int] = None, created: Optional[float] = None) -> List:
-        returnList = []
+    def iter_dns_pointer_subtypes(
+        self, override_ttl: Optional[int] = None, created: Optional[float] = None
+    ) -> Iterator[DNSPointer]:
+        """Yield a DNSPointer for each subtype of this service.
+
+        Callers that only iterate can use this to avoid materializing
+        the list.
+        """
         for subtype in self.subtypes_:
             full_subtype = "%s.%s" % (subtype, self.type)
-            returnList.append(
-                DNSPointer(
-                    full_subtype,
-                    _TYPE_PTR,
-                    _CLASS_IN,
-                    override_ttl if override_ttl is not None else self.other_ttl,
-                    self.name,
-                    created,
-                )
+            yield DNSPointer(
+                full_subtype,
+                _TYPE_PTR,
+                _CLASS_IN,
+                override_ttl if override_ttl is not None else self.other_ttl,
+                self.name,
+                created,
             )
-        return returnList
+
+    def dns_pointer_subtypes(self, override_ttl: Optional[int] = None, created: Optional[float] = None) -> List:
+        return list(self.iter_dns_pointer_subtypes(override_ttl, created))
 
     def dns_service(self, override_ttl: Optional[int] = None, created: Optional[float] = None) -> DNSService:
         """Return DNSService from ServiceInfo."""
@@ -438,10 +535,15 @@ class ServiceInfo(RecordUpdateListener):
         )
 
     def _get_address_records_from_cache(self, zc: 'Zeroconf') -> List[DNSRecord]:
-        """Get the address records from the cache."""
+        """Get the address records from the cache.
+
+        A single pass over the name bucket replaces one scan per
+        address type.
+        """
         return [
-            *zc.cache.get_all_by_details(self.server, _TYPE_A, _CLASS_IN),
-            *zc.cache.get_all_by_details(self.server, _TYPE_AAAA, _CLASS_IN),
+            record
+            for record in zc.cache.entries_with_name(self.server)
+            if record.type in _ADDRESS_RECORD_TYPES and record.class_ == _CLASS_IN
         ]
 
     def load_from_cache(self, zc: 'Zeroconf') -> bool:
@@ -490,35 +592,83 @@ class ServiceInfo(RecordUpdateListener):
         if self.load_from_cache(zc):
             return True
 
-        first_request = True
-        now = current_time_millis()
-        delay = _LISTENER_TIME
-        next_ = now
+        # loop.time() reads the same monotonic clock as
+        # current_time_millis(), so the values are interchangeable and
+        # the loop is guaranteed to be running here.
+        loop = get_running_loop()
+        assert loop is not None
+        now = loop.time() * 1000
         last = now + timeout
+        # The completion event only fires once the info is complete, so
+        # every wait runs to its deadline and the whole send schedule
+        # can be laid out up front: a doubling backoff plus the
+        # anti-synchronization jitter, capped by the overall deadline.
+        send_times = []
+        send_time = now
+        delay = _LISTENER_TIME
+        while send_time < last:
+            send_times.append(send_time)
+            send_time += delay + random.randint(*_AVOID_SYNC_DELAY_RANDOM_INTERVAL)
+            delay *= 2
         await zc.async_wait_for_start()
+        self._complete_event = complete_event = asyncio.Event()
+        self._last_request_query = None
+        # Bind the per-iteration lookups to locals; the attribute chains
+        # add up in this hot retry loop.
+        get_request_query = self._get_request_query
+        async_send = zc.async_send
+        loop_time = loop.time
         try:
-            zc.async_add_listener(self, None)
-            while not self._is_complete:
-                if last <= now:
-                    return False
-                if next_ <= now:
-                    out = self.generate_request_query(
-                        zc, now, question_type or DNSQuestionType.QU if first_request else DNSQuestionType.QM
-                    )
-                    first_request = False
-                    if not out.questions:
-                        return self.load_from_cache(zc)
-                    zc.async_send(out)
-                    next_ = now + delay
-                    delay *= 2
-                    next_ += random.randint(*_AVOID_SYNC_DELAY_RANDOM_INTERVAL)
-
-                await zc.async_wait(min(next_, last) - now)
-                now = current_time_millis()
+            # Scope the registration to the records we are asking for;
+            # this also replays any matching cache entries that land
+            # between the load_from_cache check above and here.
+            zc.async_add_listener(
+                self,
+                [
+                    DNSQuestion(self.name, _TYPE_SRV, _CLASS_IN),
+                    DNSQuestion(self.name, _TYPE_TXT, _CLASS_IN),
+                    DNSQuestion(self.server, _TYPE_A, _CLASS_IN),
+                    DNSQuestion(self.server, _TYPE_AAAA, _CLASS_IN),
+                ],
+            )
+            if self._is_complete:
+                # The cache replay above finished the job.
+                return True
+            for count, send_time in enumerate(send_times):
+                out = get_request_query(
+                    zc, now, question_type or DNSQuestionType.QU if count == 0 else DNSQuestionType.QM
+                )
+                if not out.questions:
+                    return self.load_from_cache(zc)
+                async_send(out)
+                deadline = send_times[count + 1] if count + 1 < len(send_times) else last
+                while not self._is_complete:
+                    if deadline <= now:
+                        break
+                    await wait_event_or_timeout(complete_event, timeout=millis_to_seconds(deadline - now))
+                    now = loop_time() * 1000
+                if self._is_complete:
+                    return True
+            return False
         finally:
             zc.async_remove_listener(self)
+            self._complete_event = None
 
-        return True
+    def _get_request_query(
+        self, zc: 'Zeroconf', now: float, question_type: DNSQuestionType
+    ) -> DNSOutgoing:
+        """Generate a request query, reusing the last one when possible.
+
+        Most retransmits ask exactly the same questions with the same
+        known answers, and DNSOutgoing caches its serialized packets, so
+        reusing the object skips re-encoding the wire payload entirely.
+        The cache is invalidated whenever a record update is processed.
+        """
+        request_key = (self._query_record_version, question_type)
+        if self._last_request_query is None or self._last_request_key != request_key:
+            self._last_request_query = self.generate_request_query(zc, now, question_type)
+            self._last_request_key = request_key
+        return self._last_request_query
 
     def generate_request_query(
         self, zc: 'Zeroconf', now: float, question_type: Optional[DNSQuestionType] = None
@@ -557,3 +707,11 @@ class ServiceInfo(RecordUpdateListener):
                 )
             ),
         )
+
+
+_RECORD_PROCESSORS: Dict[int, Callable[[ServiceInfo, Any], None]] = {
+    _TYPE_A: ServiceInfo._process_address,
+    _TYPE_AAAA: ServiceInfo._process_address,
+    _TYPE_SRV: ServiceInfo._process_srv,
+    _TYPE_TXT: ServiceInfo._process_text,
+}
@@ -22,8 +22,9 @@
 
 import asyncio
 import contextlib
-import queue
-from typing import Any, Awaitable, Coroutine, List, Optional, Set, cast
+from typing import Any, Awaitable, Coroutine, List, Optional, Set
+
+import async_timeout
 
 from .time import millis_to_seconds
 from ..const import _LOADED_SYSTEM_TIMEOUT
@@ -34,35 +35,15 @@ _GET_ALL_TASKS_TIMEOUT = 3
 _WAIT_FOR_LOOP_TASKS_TIMEOUT = 3  # Must be larger than _TASK_AWAIT_TIMEOUT
 
 
-def get_best_available_queue() -> queue.Queue:
-    """Create the best available queue type."""
-    if hasattr(queue, "SimpleQueue"):
-        return queue.SimpleQueue()  # type: ignore  # pylint: disable=all
-    return queue.Queue()
-
-
-# Switch to asyncio.wait_for once https://bugs.python.org/issue39032 is fixed
+# async_timeout is used instead of asyncio.wait_for because it
+# does not spawn a task per wait (https://bugs.python.org/issue39032)
 async def wait_event_or_timeout(event: asyncio.Event, timeout: float) -> None:
     """Wait for an event or timeout."""
-    loop = asyncio.get_event_loop()
-    future = loop.create_future()
-
-    def _handle_timeout_or_wait_complete(*_: Any) -> None:
-        if not future.done():
-            future.set_result(None)
-
-    timer_handle = loop.call_later(timeout, _handle_timeout_or_wait_complete)
-    event_wait = loop.create_task(event.wait())
-    event_wait.add_done_callback(_handle_timeout_or_wait_complete)
-
     try:
-        await future
-    finally:
-        timer_handle.cancel()
-        if not event_wait.done():
-            event_wait.cancel()
-        with contextlib.suppress(asyncio.CancelledError):
-            await event_wait
+        async with async_timeout.timeout(timeout):
+            await event.wait()
+    except asyncio.TimeoutError:
+        pass
 
 
 async def _async_get_all_tasks(loop: asyncio.AbstractEventLoop) -> List[asyncio.Task]:
@@ -110,14 +91,8 @@ def shutdown_loop(loop: asyncio.AbstractEventLoop) -> None:
     loop.call_soon_threadsafe(loop.stop)
 
 
-# Remove the call to _get_running_loop once we drop python 3.6 support
 def get_running_loop() -> Optional[asyncio.AbstractEventLoop]:
     """Check if an event loop is already running."""
     with contextlib.suppress(RuntimeError):
-        if hasattr(asyncio, "get_running_loop"):
-            return cast(
-                asyncio.AbstractEventLoop,
-                asyncio.get_running_loop(),  # type: ignore  # pylint: disable=no-member  # noqa
-            )
-        return asyncio._get_running_loop()  # pylint: disable=no-member,protected-access
+        return asyncio.get_running_loop()
     return None
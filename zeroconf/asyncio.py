@@ -20,10 +20,11 @@
     USA
 """
 import asyncio
-import contextlib
 from types import TracebackType  # noqa # used in type hints
 from typing import Awaitable, Callable, Dict, List, Optional, Tuple, Type, Union
 
+import async_timeout
+
 from ._core import Zeroconf
 from ._dns import DNSQuestionType
 from ._services import ServiceListener
@@ -218,8 +219,11 @@ class AsyncZeroconf:
     async def async_close(self) -> None:
         """Ends the background threads, and prevent this instance from
         servicing further queries."""
-        with contextlib.suppress(asyncio.TimeoutError):
-            await asyncio.wait_for(self.zeroconf.async_wait_for_start(), timeout=1)
+        try:
+            async with async_timeout.timeout(1):
+                await self.zeroconf.async_wait_for_start()
+        except asyncio.TimeoutError:
+            pass
         await self.async_remove_all_service_listeners()
         await self.async_unregister_all_services()
         await self.zeroconf._async_close()  # pylint: disable=protected-access